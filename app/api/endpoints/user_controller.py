@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from app.schemas.user_schema import UserCreate, UserResponse, UserLogin
 from app.services.user_service import UserService
 from app.core.database import get_db
 from app.core.security import create_access_token
+from app.core.config import settings
 from typing import List
 
 router = APIRouter(
@@ -35,12 +36,16 @@ async def create_user(user: UserCreate, db: Session = Depends(get_db)):
     return await UserService.create_user(user, db)
 
 @router.post("/login")
-async def login(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login(user_data: UserLogin, response: Response, db: Session = Depends(get_db)):
     """
     사용자 로그인을 처리합니다.
     
+    발급한 access_token은 응답 본문과 함께 HttpOnly 쿠키로도 설정되어,
+    대시보드 페이지가 서버에서 바로 인증/렌더링될 수 있도록 합니다.
+    
     Args:
         user_data: 로그인 정보
+        response: 쿠키를 설정할 응답 객체
         db: 데이터베이스 세션
         
     Returns:
@@ -63,12 +68,44 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
             detail="Incorrect email, password or user type"
         )
     
-    # Enum 값을 문자열로 변환
-    access_token = create_access_token(data={"sub": user.email, "user_type": user.user_type.value})
+    # Enum 값을 문자열로 변환 (페이지 렌더링에 필요한 이름도 토큰에 포함)
+    access_token = create_access_token(
+        data={"sub": user.email, "user_type": user.user_type.value, "name": user.name}
+    )
+    
+    # 서버 렌더링 페이지 인증용 HttpOnly 쿠키 설정
+    response.set_cookie(
+        key=settings.AUTH_COOKIE_NAME,
+        value=access_token,
+        max_age=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        httponly=True,
+        secure=settings.AUTH_COOKIE_SECURE,
+        samesite="lax"
+    )
     
     return {
         "access_token": access_token,
         "token_type": "bearer",
         "user_name": user.name,
         "user_type": user.user_type.value
-    } 
\ No newline at end of file
+    }
+
+@router.post("/logout")
+async def logout(response: Response):
+    """
+    사용자 로그아웃을 처리합니다.
+    
+    Args:
+        response: 쿠키를 삭제할 응답 객체
+        
+    Returns:
+        로그아웃 결과 메시지
+    """
+    # 설정 시와 동일한 속성으로 삭제해야 브라우저가 쿠키를 덮어씀
+    response.delete_cookie(
+        key=settings.AUTH_COOKIE_NAME,
+        httponly=True,
+        secure=settings.AUTH_COOKIE_SECURE,
+        samesite="lax"
+    )
+    return {"message": "Logged out"}
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from fastapi import HTTPException, Depends
+from fastapi import HTTPException, Depends, Request
 from fastapi.security import HTTPBearer
 from app.core.config import settings
 
@@ -26,4 +26,11 @@ def verify_token(token: str) -> dict:
 async def get_current_user(token: str = Depends(security)):
     """현재 인증된 사용자 정보 반환"""
     payload = verify_token(token.credentials)
-    return payload 
\ No newline at end of file
+    return payload
+
+def get_user_from_cookie(request: Request) -> Optional[dict]:
+    """인증 쿠키의 JWT 토큰을 검증하여 사용자 정보 반환 (없거나 유효하지 않으면 None)"""
+    token = request.cookies.get(settings.AUTH_COOKIE_NAME)
+    if not token:
+        return None
+    return verify_token(token)
@@ -9,10 +9,13 @@ from sqlalchemy import text
 from app.api.endpoints import user_router
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from fastapi.responses import RedirectResponse
 from pathlib import Path
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.core.config import settings
-from app.core.security import verify_token
+from app.core.security import verify_token, get_user_from_cookie
+from app.models.user_model import UserType
+from typing import Optional
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -72,13 +75,38 @@ def test_db_connection():
 async def signup_page(request: Request):
     return templates.TemplateResponse("signup.html", {"request": request})
 
+def render_authenticated_page(request: Request, template_name: str, required_user_type: Optional[str] = None):
+    """
+    로그인 시 설정된 HttpOnly 쿠키로 서버에서 인증 후 페이지를 렌더링합니다.
+    
+    Args:
+        request: 요청 객체
+        template_name: 렌더링할 템플릿 경로
+        required_user_type: 접근 가능한 사용자 유형 (None이면 모든 로그인 사용자)
+        
+    Returns:
+        렌더링된 페이지 또는 인증 실패 시 리다이렉트 응답
+    """
+    user = get_user_from_cookie(request)
+    if not user:
+        return RedirectResponse(url="/", status_code=303)
+    # 접근 권한이 없는 경우 본인 대시보드로 이동
+    if required_user_type and user.get("user_type") != required_user_type:
+        return RedirectResponse(url=f"/{user.get('user_type')}/dashboard", status_code=303)
+    # 사용자 정보가 포함된 페이지이므로 캐시 금지
+    return templates.TemplateResponse(
+        template_name,
+        {"request": request, "user": user},
+        headers={"Cache-Control": "no-store"}
+    )
+
 @app.get("/member/dashboard")
 async def member_dashboard(request: Request):
-    return templates.TemplateResponse("member/dashboard.html", {"request": request})
+    return render_authenticated_page(request, "member/dashboard.html")
 
 @app.get("/trainer/dashboard")
 async def trainer_dashboard(request: Request):
-    return templates.TemplateResponse("trainer/dashboard.html", {"request": request})
+    return render_authenticated_page(request, "trainer/dashboard.html", UserType.TRAINER.value)
 
 @app.get("/api/member/verify-auth")
 async def verify_auth(token_data: dict = Depends(verify_token_middleware)):